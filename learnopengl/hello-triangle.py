@@ -15,22 +15,290 @@ and, of course, the PySide2 documentation.
 
 """
 
+import os
 import sys
 
-import numpy as np
 import ctypes
-
-# Used to access OpenGL enums
-from OpenGL import GL as pygl
+import struct
 
 from PySide2 import QtWidgets, QtCore, QtGui
-import shiboken2
+# Pointers are passed to Qt as VoidPtr.  A ctypes.c_void_p would be
+# read through the buffer protocol, giving Qt the address of the
+# c_void_p itself rather than the address it holds.  VoidPtr comes
+# from the shiboken2 copy bundled with PySide2, which is already
+# loaded by the import above.
+from PySide2.shiboken2 import VoidPtr
+
+
+# Set the GL_TUTORIAL_DEBUG environment variable to print the OpenGL
+# driver info and the state of each object as it is set up.
+DEBUG = bool(os.environ.get("GL_TUTORIAL_DEBUG"))
+
+# Size of a float as packed by struct, matching vertex_data
+FLOAT_SIZE = struct.calcsize("f")
+
+# Bytes between consecutive vertices made of a single vec3
+VEC3_STRIDE = 3 * FLOAT_SIZE
+
+# OpenGL enums are plain integers.  Only a handful are needed, so they
+# are defined here rather than importing all of PyOpenGL to get them.
+# Values are taken from the OpenGL registry:
+# https://github.com/KhronosGroup/OpenGL-Registry/blob/main/api/GL/glcorearb.h
+GL_FALSE = 0
+GL_TRIANGLES = 0x0004
+GL_FLOAT = 0x1406
+GL_VENDOR = 0x1F00
+GL_RENDERER = 0x1F01
+GL_VERSION = 0x1F02
+GL_COLOR_BUFFER_BIT = 0x4000
+GL_ARRAY_BUFFER = 0x8892
+GL_MAP_WRITE_BIT = 0x0002
+GL_MAP_PERSISTENT_BIT = 0x0040
+GL_MAP_COHERENT_BIT = 0x0080
+GL_SHADING_LANGUAGE_VERSION = 0x8B8C
+
+# Compiling GLSL and linking programs is slow relative to everything
+# else done at initialization.  Widgets whose contexts share resources
+# (see QtCore.Qt.AA_ShareOpenGLContexts) can reuse the same programs,
+# so they are cached per context share group and keyed by their source
+# code.  Entries are dropped when their share group is destroyed (see
+# forget_with_share_group()).
+_PROGRAM_CACHE = {}
+
+
+def forget_with_share_group(share_group, cache, key):
+    """Remove cache[key] once share_group is destroyed.
+
+    A share group is destroyed along with the last of its contexts,
+    which also deletes every OpenGL object the group held.  Qt
+    invalidates its wrappers around those objects (e.g.
+    QtGui.QOpenGLBuffer) at that point, so dropping them afterwards
+    issues no OpenGL calls.  Forgetting them keeps dead GL names from
+    being handed out should a new group reuse the old one's address.
+
+    """
+    share_group.destroyed.connect(lambda: cache.pop(key, None))
+
+
+def link_program(vertex_shader_code, fragment_shader_code):
+    """Return a linked QtGui.QOpenGLShaderProgram for the given sources.
+
+    Requires a current OpenGL context.  Programs are compiled and
+    linked once per context share group.
+
+    """
+    share_group = QtGui.QOpenGLContext.currentContext().shareGroup()
+    key = (share_group, vertex_shader_code, fragment_shader_code)
+    program = _PROGRAM_CACHE.get(key)
+    if program is None:
+        # The shaders are compiled straight into the program.  Only
+        # the program keeps a handle to them, and they are released
+        # along with it.
+        program = QtGui.QOpenGLShaderProgram()
+        if not program.addShaderFromSourceCode(QtGui.QOpenGLShader.Vertex, vertex_shader_code):
+            raise ValueError("Vertex shader did not compile:\n {0}".format(program.log()))
+        if not program.addShaderFromSourceCode(QtGui.QOpenGLShader.Fragment, fragment_shader_code):
+            raise ValueError("Fragment shader did not compile:\n {0}".format(program.log()))
+        program.bindAttributeLocation("aPos", 0)
+        if not program.link():
+            raise ValueError("Program did not link:\n {0}".format(program.log()))
+        _PROGRAM_CACHE[key] = program
+        forget_with_share_group(share_group, _PROGRAM_CACHE, key)
+    return program
+
+
+def buffer_storage_functions():
+    """Return OpenGL 4.4 functions for the current context, or None.
+
+    glBufferStorage() is only available from OpenGL 4.4 onwards and
+    is not part of QtGui.QOpenGLFunctions.  None is returned when the
+    context is older, is OpenGL ES, or PySide2 was built without the
+    desktop OpenGL function classes.
+
+    """
+    context = QtGui.QOpenGLContext.currentContext()
+    fmt = context.format()
+    if context.isOpenGLES() or (fmt.majorVersion(), fmt.minorVersion()) < (4, 4):
+        return None
+
+    functions_class = getattr(QtGui, "QOpenGLFunctions_4_4_Core", None)
+    if functions_class is None:
+        return None
+
+    gl_funcs = functions_class()
+    if not gl_funcs.initializeOpenGLFunctions():
+        return None
+    return gl_funcs
+
+
+def bind_vec3_attribute(gl_funcs, location, stride, offset):
+    """Describe and enable a vec3 vertex attribute.
+
+    The attribute reads from whichever buffer is bound to the current
+    context.  Both stride and offset are given in bytes, so the same
+    buffer can interleave several attributes.
+
+    """
+    # This is done with 'glVertexAttribPointer' which defines an
+    # array of generic vertex attribute data.  The vertex shader is
+    # executed for each vertex given to the rendering pipeline.  This
+    # information is captured by the VAO.
+    gl_funcs.glVertexAttribPointer(location,         # index of vertex attribute
+                                   3,                # size of each vertex; 3 for vec3
+                                   GL_FLOAT,         # type of each element in the array
+                                   GL_FALSE,         # should the shader normalize the data?
+                                   stride,           # space between consecutive attributes
+                                   VoidPtr(offset)   # offset of where data begins
+                                   )
+
+    # Enable the (shader) vertex attribute.  This must be called
+    # prior to rendering.  Which attributes are enabled/disabled is
+    # tracked by the VAO.
+    gl_funcs.glEnableVertexAttribArray(location)
 
 
-FLOAT_SIZE = ctypes.sizeof(ctypes.c_float)
+class GLWidget(QtWidgets.QOpenGLWidget):
 
+    # This GLWidget will draw a triangle.  A triangle consists of
+    # three points in 2D.  Each point is called a vertex.  OpenGL
+    # processes data represented as 3D or 4D vectors.  When 2D
+    # vertices are represented as 3D vectors, the z-coordinate should
+    # be set to 0.  OpenGL only processes 'normalized device
+    # coordinates'; values between -1.0 and 1.0.  Any data outside
+    # this range will not be displayed.  Data may be normalized prior
+    # to loading, as done here, or afterwards.
+    #
+    # Every triangle is the same, so the data is stored on the class
+    # and uploaded to the GPU only once (see shared_vbo()).  The
+    # vertices are packed into bytes as native floats, the layout the
+    # GPU expects, once when the module is imported.
+    vertex_data = struct.pack(
+        "9f",
+        -0.5, -0.5, 0.0,   # x, y, z
+         0.5, -0.5, 0.0,   # x, y, z
+         0.0,  0.5, 0.0,   # x, y, z
+    )
+
+    # The triangle never changes once uploaded.  Subclasses whose
+    # vertices are updated after upload (see write_vertices()) should
+    # set this to True.  Each such widget then gets a VBO of its own
+    # instead of the shared one.
+    dynamic_vertices = False
+
+    # Uploaded vertex buffers, one per class and context share group.
+    # Subclasses may override vertex_data, so the class is part of the
+    # key.  Each is forgotten when its share group is destroyed.
+    _vbos = {}
+
+    @classmethod
+    def shared_vbo(cls):
+        """Return the VBO holding vertex_data, creating it if needed.
+
+        Requires a current OpenGL context.  The data is uploaded once
+        per class and context share group.  Only used for static
+        vertices.
 
-class GLWidget(QtWidgets.QOpenGLWidget):
+        """
+        share_group = QtGui.QOpenGLContext.currentContext().shareGroup()
+        key = (cls, share_group)
+        vbo = cls._vbos.get(key)
+        if vbo is None:
+            vbo, _ = cls.create_vbo()
+            cls._vbos[key] = vbo
+            forget_with_share_group(share_group, cls._vbos, key)
+        return vbo
+
+    @classmethod
+    def create_vbo(cls):
+        """Return a new VBO holding vertex_data and its mapped address.
+
+        Requires a current OpenGL context.  The address is that of a
+        persistent mapping of the buffer, or None when the buffer is
+        not persistently mapped.
+
+        """
+        # The Vertex Buffer Object (VBO) is used to manage memory in
+        # the GPU.  It allocates space and specifies the usage pattern
+        # for the data (default is GL_STATIC_DRAW). As the name
+        # implies, the VBO is an OpenGL object; it represents a subset
+        # of OpenGL's state.  Note that the object provided here (by
+        # the API) is simply a handle.  The actual buffer will exist
+        # on the GPU.  It's not until the vbo is created that the
+        # object is actually initialized on the GPU.
+        #
+        # For descriptions of usage patterns, see
+        # https://doc-snapshots.qt.io/qtforpython-5.15/PySide2/QtGui/QOpenGLBuffer.html?highlight=qopenglbuffer#PySide2.QtGui.PySide2.QtGui.QOpenGLBuffer.UsagePattern
+        #
+        # The triangle never changes, so the usage pattern is stated
+        # explicitly rather than relying on the default.  This tells
+        # the driver the data is uploaded once and drawn many times,
+        # letting it keep the buffer in GPU memory.  Dynamic vertices
+        # are instead hinted as written often.  The usage pattern
+        # only applies to storage made by allocate(), not to the
+        # persistently mapped storage below.
+        if cls.dynamic_vertices:
+            usage_pattern = QtGui.QOpenGLBuffer.DynamicDraw
+        else:
+            usage_pattern = QtGui.QOpenGLBuffer.StaticDraw
+        vbo = QtGui.QOpenGLBuffer(QtGui.QOpenGLBuffer.VertexBuffer)
+        vbo.setUsagePattern(usage_pattern)
+        vbo.create()
+        vbo.bind()
+
+        nbytes = len(cls.vertex_data)
+
+        persistent = None
+        gl44_funcs = buffer_storage_functions() if cls.dynamic_vertices else None
+        if gl44_funcs is not None:
+            # OpenGL 4.4 can give the buffer immutable storage which
+            # stays mapped for its whole life ("persistent mapping").
+            # New vertex values can then be written straight into the
+            # mapped memory instead of being uploaded again.  Coherent
+            # mapping makes those writes visible to the GPU without
+            # an explicit flush.  The buffer is never unmapped.  Such
+            # storage usually lives in memory the CPU can see, which
+            # is slower for the GPU to read, so static vertices never
+            # take this path.
+            flags = GL_MAP_WRITE_BIT | GL_MAP_PERSISTENT_BIT | GL_MAP_COHERENT_BIT
+            gl44_funcs.glBufferStorage(GL_ARRAY_BUFFER, nbytes, VoidPtr(0), flags)
+            persistent = gl44_funcs.glMapBufferRange(GL_ARRAY_BUFFER, 0, nbytes, flags)
+            if persistent is not None and int(persistent):
+                persistent = int(persistent)
+                ctypes.memmove(persistent, cls.vertex_data, nbytes)
+            else:
+                # Immutable storage cannot be reallocated, so start
+                # over with a fresh buffer and upload it as usual.
+                persistent = None
+                vbo.release()
+                vbo.destroy()
+                vbo.create()
+                vbo.bind()
+
+        if persistent is None:
+            # Once the VBO has been created and bound to the current
+            # context, space is reserved on the GPU.  Note that the
+            # size of the data must be defined.  This step is akin to
+            # calling 'glBufferData' with a null pointer.  The main
+            # difference is that the usage pattern was defined when
+            # the VBO was instantiated.
+            vbo.allocate(nbytes)
+
+            # Mapping the buffer gives the client direct access to
+            # memory chosen by the driver, usually memory it can
+            # transfer to the GPU without an intermediate copy.  The
+            # vertex data is copied straight into it.  Not every
+            # implementation supports mapping (e.g. OpenGL ES 2.0),
+            # in which case the data is written through the buffer
+            # instead.
+            mapped = vbo.map(QtGui.QOpenGLBuffer.WriteOnly)
+            if mapped is not None and int(mapped):
+                ctypes.memmove(int(mapped), cls.vertex_data, nbytes)
+                vbo.unmap()
+            else:
+                vbo.write(0, cls.vertex_data, nbytes)
+        vbo.release()
+
+        return vbo, persistent
 
     def __init__(self, parent=None):
         # OpenGL is a client-server architecture. The graphics engine,
@@ -44,43 +312,24 @@ class GLWidget(QtWidgets.QOpenGLWidget):
         # context (i.e. the OpenGL GPU state-machine).
         super().__init__(parent)
 
-        # This GLWidget will draw a triangle.  A triangle consists of
-        # three points in 2D.  Each point is called a vertex.  OpenGL
-        # processes data represented as 3D or 4D vectors.  When 2D
-        # vertices are represented as 3D vectors, the z-coordinate
-        # should be set to 0.  OpenGL only processes 'normalized
-        # device coordinates'; values between -1.0 and 1.0.  Any data
-        # outside this range will not be displayed.  Data may be
-        # normalized prior to loading, as done here, or afterwards.
-        self.vertex_data = np.array(
-            [-0.5, -0.5, 0.0,   # x, y, z
-              0.5, -0.5, 0.0,   # x, y, z
-              0.0,  0.5, 0.0],  # x, y, z
-            dtype=ctypes.c_float
-        )
-
-        # Qt allows OpenGL objects to be instantiated prior to
-        # initialization.  Several objects are created here
-        # (instantiated, actually) but it's not until
-        # QtWidgets.QOpenGLWidget.initializeGL() is called that they
-        # can be initialized.  The deferred initialization requires
-        # developers to manually initialize these objects (via
-        # corresponding create() method calls).
-
-        # The Vertex Buffer Object (VBO) is used to manage memory in
-        # the GPU.  It allocates space and specifies the usage pattern
-        # for the data (default is GL_STATIC_DRAW). As the name
-        # implies, the VBO is an OpenGL object; it represents a subset
-        # of OpenGL's state.  Note that the object provided here (by
-        # the API) is simply a handle.  The actual buffer will exist
-        # on the GPU.  It's not until
-        # QtWidgets.QOpenGLWidget.initializeGL() is called, and the
-        # vbo is created, that the object is actually initialized on
-        # the GPU.
-        #
-        # For descriptions of usage patterns, see
-        # https://doc-snapshots.qt.io/qtforpython-5.15/PySide2/QtGui/QOpenGLBuffer.html?highlight=qopenglbuffer#PySide2.QtGui.PySide2.QtGui.QOpenGLBuffer.UsagePattern
-        self.vbo = QtGui.QOpenGLBuffer(QtGui.QOpenGLBuffer.VertexBuffer)
+        # The triangle never moves.  QOpenGLWidget renders into a
+        # framebuffer which, with partial updates enabled, keeps its
+        # contents between calls to paintGL().  Once drawn, the
+        # triangle only needs redrawing when that framebuffer is
+        # replaced.  That happens whenever its size in device pixels
+        # changes: on resize, but also when the window moves to a
+        # screen with a different device pixel ratio, which does not
+        # call resizeGL().  paintGL() therefore compares the size it
+        # last drew at against the current one.  Anything that
+        # changes the scene should set the dirty flag before calling
+        # update().
+        self.setUpdateBehavior(QtWidgets.QOpenGLWidget.PartialUpdate)
+        self.dirty = True
+        self.drawn_size = None
+
+        # Created in initializeGL()
+        self.vbo = None
+        self.vbo_mapping = None
 
         # Data is passed to the GPU and processed through a pipeline,
         # or sequence of steps.  Each step is represented by a
@@ -161,19 +410,25 @@ class GLWidget(QtWidgets.QOpenGLWidget):
         # Vertex Array Object (VAO).  A VA0 is used to switch between
         # contexts and stores buffer and attribute states.  Because of
         # this, a VAO should be bound before a VBO.
+        #
+        # Unlike buffers and shader programs, VAOs are never shared
+        # between contexts.  Each QOpenGLWidget has a context of its
+        # own, so this single VAO serves as the one global VAO of that
+        # context.
         self.vao = QtGui.QOpenGLVertexArrayObject()
 
     def getGlInfo(self):
+        gl_funcs = self.context().functions()
         info = """
             Vendor: {0}
             Renderer: {1}
             OpenGL Version: {2}
             Shader Version: {3}
             """.format(
-            pygl.glGetString(pygl.GL_VENDOR),
-            pygl.glGetString(pygl.GL_RENDERER),
-            pygl.glGetString(pygl.GL_VERSION),
-            pygl.glGetString(pygl.GL_SHADING_LANGUAGE_VERSION)
+            gl_funcs.glGetString(GL_VENDOR),
+            gl_funcs.glGetString(GL_RENDERER),
+            gl_funcs.glGetString(GL_VERSION),
+            gl_funcs.glGetString(GL_SHADING_LANGUAGE_VERSION)
         )
         return info
 
@@ -191,8 +446,10 @@ class GLWidget(QtWidgets.QOpenGLWidget):
 
         """
 
-        # OpenGL is now available.  Grab and display its info.
-        print(self.getGlInfo(), flush=True)
+        # OpenGL is now available.  Grab and display its info.  The
+        # info is only queried when it will be shown.
+        if DEBUG:
+            print(self.getGlInfo(), flush=True)
 
         # There are several ways to interact with OpenGL:
         #
@@ -215,14 +472,21 @@ class GLWidget(QtWidgets.QOpenGLWidget):
         # See: https://doc-snapshots.qt.io/qtforpython-5.15/PySide2/QtGui/QOpenGLFunctions.html#more
         #
         # The simplest way to access OpenGL functions is through the
-        # context instance.  The only way, AFAICT, to access OpenGL
-        # enums is through PyOpenGL.
-        gl_funcs = self.context().functions()
+        # context instance.  Qt does not expose the OpenGL enums, but
+        # they are just integers and the few needed here are defined
+        # at the top of this module.
+        #
+        # The functions belong to the context, which lives as long as
+        # the widget does.  Should the context be recreated (e.g. when
+        # the widget is reparented), initializeGL() is called again.
+        # Looking them up once here spares paintGL() from doing so
+        # every frame.
+        self.gl_funcs = self.context().functions()
+        gl_funcs = self.gl_funcs
 
         # The minimal OpenGL application requires a vertex shader and
         # a fragment shader.  Shaders are GLSL code which has been
-        # compiled and linked within the GPU.  Qt handles compiling
-        # with a QtGui.QOpenGLShader object and linking with a
+        # compiled and linked within the GPU.  Qt handles both with a
         # QtGui.QOpenGLShaderProgram.
 
         # In order for the shader to be compiled, an OpenGL context
@@ -233,87 +497,112 @@ class GLWidget(QtWidgets.QOpenGLWidget):
         # difference between the QOpenGLWidget and the legacy
         # QGLWidget.
 
-        # Here, the shaders are defined only within the scope of
-        # initialization.  Remember that the shaders actually exist on
-        # the GPU and that the objects here are merely the interface.
-        # Therefore, these objects do not need an extended lifetime
-        # beyond their immediate use (i.e. no need for 'self').
-        vertex_shader = QtGui.QOpenGLShader(QtGui.QOpenGLShader.Vertex)
-        is_compiled = vertex_shader.compileSourceCode(self.vertex_shader_code)
-        if not is_compiled:
-            raise ValueError("Vertex shader did not compile:\n {0}".format(self.vertex_shader_code))
-
-        fragment_shader = QtGui.QOpenGLShader(QtGui.QOpenGLShader.Fragment)
-        is_compiled = fragment_shader.compileSourceCode(self.fragment_shader_code)
-        if not is_compiled:
-            raise ValueError("Fragment shader did not compile:\n {0}".format(self.fragment_shader_code))
-
-        # The vertex and fragment shaders are linked into a single
-        # program.  This program is called whenever rendering occurs.
+        # The shaders are compiled and linked into a single program.
+        # This program is called whenever rendering occurs.
         # Rendering is the process of converting higher dimension data
         # representations into the 2D images displayed on-screen
         # (i.e. the shader pipeline).  Rendering happens whenever the
         # object is redrawn (e.g. window resize), so the program
         # should be stored in an attribute for future reference.
-        self.program = QtGui.QOpenGLShaderProgram()
-        self.program.addShader(vertex_shader)
-        self.program.addShader(fragment_shader)
-        self.program.bindAttributeLocation("aPos", 0)
-
-        self.program.link()
-        print("Program linked: ", self.program.isLinked(), flush=True)
+        #
+        # Remember that the shaders actually exist on the GPU and that
+        # the objects here are merely the interface.  Any other widget
+        # sharing this context's resources can therefore reuse them;
+        # link_program() takes care of compiling and linking only
+        # once.
+        self.program = link_program(self.vertex_shader_code,
+                                    self.fragment_shader_code)
+        if DEBUG:
+            print("Program linked: ", self.program.isLinked(), flush=True)
 
         is_program_bound = self.program.bind()
-        print('Program bound: ', is_program_bound, flush=True)
+        if DEBUG:
+            print('Program bound: ', is_program_bound, flush=True)
 
         # Now that a context exists, the VAO and VBO can be created.
 
-        # VAO - bind before VBO to capture state!
-        self.vao.create()
-        print('VAO created: ', self.vao.isCreated(), flush=True)
-
-        self.vao_binder = QtGui.QOpenGLVertexArrayObject.Binder(self.vao)
-        print('VAO bound: ', self.vao_binder, flush=True)
-
-        # VBO
-        self.vbo.create()
-        print('VBO created: ', self.vbo.isCreated(), flush=True)
+        # VAO - bind before VBO to capture state!  A single VAO is
+        # created right after the context is made current.  It is
+        # destroyed along with its context, so it is only (re)created
+        # when missing.
+        if not self.vao.isCreated():
+            self.vao.create()
+        if DEBUG:
+            print('VAO created: ', self.vao.isCreated(), flush=True)
+
+        # The VAO is bound once and never released; it is the only
+        # VAO this context uses.
+        self.vao.bind()
+        if DEBUG:
+            print('VAO bound: ', self.vao.objectId(), flush=True)
+
+        # VBO - static vertex data is uploaded only once and shared.
+        # Dynamic vertex data gets a buffer of its own so that
+        # updating it moves only this widget's triangle.  That buffer
+        # lives in this widget's context and is released with it.
+        if self.dynamic_vertices:
+            self.vbo, self.vbo_mapping = self.create_vbo()
+            self.context().aboutToBeDestroyed.connect(self.release_vbo)
+        else:
+            self.vbo = self.shared_vbo()
+        if DEBUG:
+            print('VBO created: ', self.vbo.isCreated(), flush=True)
 
         is_vbo_bound = self.vbo.bind()
-        print('VBO bound: ', is_vbo_bound, flush=True)
-
-        # Once the VBO has been created and bound to the current
-        # context, copy data over to the GPU.  Note that the size of
-        # the data must be defined.  This step is akin to calling
-        # 'glBufferData'.  The main difference is that the usage
-        # pattern was defined when the VBO was instantiated.
-        self.vbo.allocate(self.vertex_data.tobytes(), FLOAT_SIZE * self.vertex_data.size)
-
-        # The vertex shader needs to know how to parse the data.  This
-        # is done with 'glVertexAttribPointer' which defines an array
-        # of generic vertex attribute data. It does this with whatever
-        # buffer is bound to the current context. The vertex shader is
-        # executed for each vertex that given to the rendering
-        # pipeline.  This information is captured by the VAO.
-        gl_funcs.glVertexAttribPointer(0,                    # index of vertex attribute
-                                       3,                    # size of each vertex; 3 for vec3
-                                       int(pygl.GL_FLOAT),   # type of each element in the array
-                                       int(pygl.GL_FALSE),   # should the shader normalize the data?
-                                       3 * FLOAT_SIZE,       # space between consecutive attributes (stride); each attribute is vec3
-                                       shiboken2.VoidPtr(0)  # offset of where data begins
-                                       )
-
-        # Enable the (shader) vertex attribute at index 0.  This must
-        # be called prior to rendering.  Which attributes are
-        # enabled/disabled is tracked by the VAO.
-        gl_funcs.glEnableVertexAttribArray(0)
-
-        # The VAO records the (un)binding of the VBO.  Be sure to
-        # unbind the VAO *before* unbinding the VBO (unless the
-        # release is to be recorded).
-        self.vao_binder.release()
+        if DEBUG:
+            print('VBO bound: ', is_vbo_bound, flush=True)
+
+        # The vertex shader needs to know how to parse the data.  The
+        # triangle has a single attribute, its position, at index 0.
+        bind_vec3_attribute(gl_funcs, 0, VEC3_STRIDE, 0)
+
+        # The VAO has already captured which buffer the attribute
+        # reads from, so the VBO itself can be released.  The VAO and
+        # program, however, are left bound.  This widget's context
+        # never uses another VAO or program, so there is no need to
+        # rebind them every time the scene is drawn.
         self.vbo.release()
-        self.program.release()
+
+        # A new context has nothing drawn in it yet
+        self.dirty = True
+
+    def release_vbo(self):
+        """Destroy this widget's own VBO along with its context."""
+        # The context is still current here, so the buffer can be
+        # deleted properly.  The mapped address dies with it.
+        self.vbo_mapping = None
+        if self.vbo is not None:
+            self.vbo.destroy()
+            self.vbo = None
+
+    def write_vertices(self, data):
+        """Replace this widget's vertex data and schedule a redraw.
+
+        Only widgets with dynamic_vertices set can be updated.  data is
+        packed like vertex_data and must be no larger than it.
+
+        """
+        if not self.dynamic_vertices:
+            raise ValueError("{0} has static vertices".format(type(self).__name__))
+        if self.vbo is None:
+            raise ValueError("OpenGL has not been initialized")
+        if len(data) > len(self.vertex_data):
+            raise ValueError("Vertex data of {0} bytes exceeds the buffer's {1} bytes".format(
+                len(data), len(self.vertex_data)))
+
+        if self.vbo_mapping is not None:
+            # Coherent mapping: the GPU sees the new vertices without
+            # any OpenGL calls.
+            ctypes.memmove(self.vbo_mapping, data, len(data))
+        else:
+            self.makeCurrent()
+            self.vbo.bind()
+            self.vbo.write(0, data, len(data))
+            self.vbo.release()
+            self.doneCurrent()
+
+        self.dirty = True
+        self.update()
 
     def paintGL(self):
         """Render the OpenGL scene.
@@ -322,24 +611,24 @@ class GLWidget(QtWidgets.QOpenGLWidget):
 
         """
 
-        # clean up what was drawn
-        funcs = self.context().functions()
-        funcs.glClear(pygl.GL_COLOR_BUFFER_BIT)
+        # The framebuffer still holds the last frame unless it was
+        # replaced by one of a different size or pixel ratio
+        size = (self.width(), self.height(), self.devicePixelRatioF())
+        if not self.dirty and size == self.drawn_size:
+            return
+        self.dirty = False
+        self.drawn_size = size
 
-        # Binding here is redundant since there is only a single
-        # context
-        self.vao_binder.rebind()
+        # clean up what was drawn
+        funcs = self.gl_funcs
+        funcs.glClear(GL_COLOR_BUFFER_BIT)
 
-        # Bind which shaders to apply
-        self.program.bind()
+        # The VAO and program bound in initializeGL() are still bound
 
         # Render primitives (e.g. triangles) from array data
-        funcs.glDrawArrays(pygl.GL_TRIANGLES, # what kind of primitives to render
-                           0,                 # starting index in the enabled arrays
-                           3)                 # number of indices to read; done in 3s because GL_TRIANGLES
-
-        self.program.release()
-        self.vao_binder.release()
+        funcs.glDrawArrays(GL_TRIANGLES,  # what kind of primitives to render
+                           0,             # starting index in the enabled arrays
+                           3)             # number of indices to read; done in 3s because GL_TRIANGLES
 
 
 class MainWindow(QtWidgets.QMainWindow):
@@ -362,29 +651,22 @@ class MainWindow(QtWidgets.QMainWindow):
         self.menu_file.addAction(self.exit_action)
         self.setMenuBar(self.menu_bar)
 
-        self.x_slider = QtWidgets.QSlider(QtCore.Qt.Vertical)
-        self.x_slider.setRange(0, 360 * 16)
-        self.x_slider.setSingleStep(16)
-        self.x_slider.setPageStep(15 * 16)
-        self.x_slider.setTickInterval(15 * 16)
-        self.x_slider.setTickPosition(QtWidgets.QSlider.TicksRight)
-
-        self.y_slider = QtWidgets.QSlider(QtCore.Qt.Vertical)
-        self.y_slider.setRange(0, 360 * 16)
-        self.y_slider.setSingleStep(16)
-        self.y_slider.setPageStep(15 * 16)
-        self.y_slider.setTickInterval(15 * 16)
-        self.y_slider.setTickPosition(QtWidgets.QSlider.TicksRight)
-
-        self.z_slider = QtWidgets.QSlider(QtCore.Qt.Vertical)
-        self.z_slider.setRange(0, 360 * 16)
-        self.z_slider.setSingleStep(16)
-        self.z_slider.setPageStep(15 * 16)
-        self.z_slider.setTickInterval(15 * 16)
-        self.z_slider.setTickPosition(QtWidgets.QSlider.TicksRight)
+        self.x_slider = self.make_angle_slider()
+        self.y_slider = self.make_angle_slider()
+        self.z_slider = self.make_angle_slider()
 
         self.gl_widget = GLWidget()
 
+    def make_angle_slider(self):
+        """Return a vertical slider over 0-360 degrees in 1/16ths."""
+        slider = QtWidgets.QSlider(QtCore.Qt.Vertical)
+        slider.setRange(0, 360 * 16)
+        slider.setSingleStep(16)
+        slider.setPageStep(15 * 16)
+        slider.setTickInterval(15 * 16)
+        slider.setTickPosition(QtWidgets.QSlider.TicksRight)
+        return slider
+
     def init_layout(self):
         layout = QtWidgets.QVBoxLayout()
         layout.addWidget(self.gl_widget)
@@ -400,6 +682,23 @@ class MainWindow(QtWidgets.QMainWindow):
 
 if __name__ == '__main__':
 
+    # The surface format describes the contexts Qt should create.
+    # The shaders are written for OpenGL 3.3 core.  A swap interval
+    # of 1 synchronizes buffer swaps with the display's refresh
+    # (vsync) so frames are never drawn faster than they can be
+    # shown.  Setting it as the default before the application exists
+    # means every context is created this way from the start, rather
+    # than being recreated once a widget asks for a different format.
+    fmt = QtGui.QSurfaceFormat()
+    fmt.setVersion(3, 3)
+    fmt.setProfile(QtGui.QSurfaceFormat.CoreProfile)
+    fmt.setSwapInterval(1)
+    QtGui.QSurfaceFormat.setDefaultFormat(fmt)
+
+    # Let every context share resources so that the cached programs
+    # and vertex buffers are reused across windows.
+    QtCore.QCoreApplication.setAttribute(QtCore.Qt.AA_ShareOpenGLContexts)
+
     app = QtWidgets.QApplication(sys.argv)
     main_window = MainWindow()
     main_window.show()